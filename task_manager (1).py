@@ -4,31 +4,354 @@
 # It uses a file-based approach to store tasks and user information.
 # PEP 8 Compliant Version with DD-MM-YYYY date format
 
+import bisect
+import json
 import os
+import tempfile
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime, date
 
 # Constants
 DATETIME_STRING_FORMAT = "%d-%m-%Y"  # Changed from YYYY-MM-DD to DD-MM-YYYY
 SEPARATOR_LINE = "_" * 80
 
+# Two-column layout of a task, shared by tasks.txt and the task display
+TASK_BLOCK_TEMPLATE = (
+    f"{SEPARATOR_LINE}\n"
+    f"{'Task:':<20}{{title}}\n"
+    f"{'Assigned to:':<20}{{username}}\n"
+    f"{'Date Assigned:':<20}{{assigned_date}}\n"
+    f"{'Due Date:':<20}{{due_date}}\n"
+    f"{'Completed:':<20}{{completed}}\n"
+    f"{'Task Description:':<20}\n{{description}}\n"
+    f"{SEPARATOR_LINE}"
+)
+TASKS_CACHE_FILE = "tasks.cache.json"
+USERS_CACHE_FILE = "user.cache.json"
+DAMAGED_LOG_WARNING = ("Warning: tasks.txt contains damaged records. "
+                       "Changes will not be saved until the file is repaired.")
+
+# Positions in task_list of each user's tasks, kept in sync with task_list
+tasks_by_user = {}
+
+# Registered users mapping usernames to passwords, loaded on first use by get_users()
+_USERS = None
+
+# Number of records (tasks and edits) in tasks.txt, or None if the file
+# is not in the log format and must be rewritten before appending
+_task_log_records = None
+
+# True if tasks.txt has records that could not be parsed. The file is then
+# left untouched, since its task numbers no longer match task_list
+_task_log_damaged = False
+
+# True once this process has appended records that compaction could fold in
+_task_log_appended = False
+
+
+def _parse_ddmmyyyy(date_string):
+    """
+    Parse a DD-MM-YYYY string into a datetime.
+    Slices the fixed-width string directly and only falls back to strptime
+    when the input does not have the expected layout.
+    
+    Args:
+        date_string (str): Date in DD-MM-YYYY format
+        
+    Returns:
+        datetime: Parsed date at midnight
+        
+    Raises:
+        ValueError: If the string is not a valid DD-MM-YYYY date
+    """
+    s = date_string
+    if len(s) == 10 and s[2] == '-' and s[5] == '-' and (s[0:2] + s[3:5] + s[6:10]).isdigit():
+        return datetime(int(s[6:10]), int(s[3:5]), int(s[0:2]))
+    return datetime.strptime(s, DATETIME_STRING_FORMAT)
+
+
+def _parse_iso(date_string):
+    """
+    Parse a YYYY-MM-DD string, as used by the old task file format, into a datetime.
+    
+    Args:
+        date_string (str): Date in YYYY-MM-DD format
+        
+    Returns:
+        datetime: Parsed date at midnight
+        
+    Raises:
+        ValueError: If the string is not a valid YYYY-MM-DD date
+    """
+    s = date_string
+    if len(s) == 10 and s[4] == '-' and s[7] == '-' and (s[0:4] + s[5:7] + s[8:10]).isdigit():
+        return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+    return datetime.strptime(s, "%Y-%m-%d")
+
+
+def _fmt_dmy(d):
+    """
+    Format a date as DD-MM-YYYY without going through strftime.
+    
+    Args:
+        d (datetime): Date to format
+        
+    Returns:
+        str: Date in DD-MM-YYYY format
+    """
+    return f"{d.day:02d}-{d.month:02d}-{d.year}"
+
+
+def _format_task_block(t):
+    """
+    Format a task as an aligned two-column block.
+    
+    Args:
+        t (dict): Task dictionary
+        
+    Returns:
+        str: Task block framed by separator lines
+    """
+    return TASK_BLOCK_TEMPLATE.format_map({
+        'title': t['title'],
+        'username': t['username'],
+        'assigned_date': _fmt_dmy(t['assigned_date']),
+        'due_date': _fmt_dmy(t['due_date']),
+        'completed': 'Yes' if t['completed'] else 'No',
+        'description': t['description']
+    })
+
+
+def _file_signature(path):
+    """
+    Identify the current contents of a file by its modification time and size.
+    
+    Args:
+        path (str): Path of the file
+        
+    Returns:
+        list: [mtime in nanoseconds, size in bytes], or None if the file can't be read
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+@contextmanager
+def _atomic_write(path, buffering=-1, durable=True):
+    """
+    Open a temporary file next to path and move it over path once written.
+    The original file is left untouched if writing fails part way through,
+    and the new file keeps the original's permissions.
+    
+    Args:
+        path (str): Destination file path
+        buffering (int): Buffer size passed to the file object
+        durable (bool): Whether to fsync the contents before replacing path
+        
+    Yields:
+        file: Open text file to write the new contents to
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                    prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", buffering=buffering) as tmp_file:
+            yield tmp_file
+            if durable:
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+                
+        # mkstemp creates owner-only files, so restore the usual mode
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_json_atomic(path, data):
+    """
+    Write data as JSON to a temporary file and move it over path.
+    The cache can always be rebuilt from the text files, so it is not fsynced.
+    
+    Args:
+        path (str): Destination file path
+        data: JSON-serialisable data
+    """
+    with _atomic_write(path, durable=False) as cache_file:
+        json.dump(data, cache_file)
+
+
+def _load_tasks_cached(source_signature):
+    """
+    Load tasks from the JSON cache if it was built from the current tasks.txt.
+    
+    Args:
+        source_signature (list): Current signature of tasks.txt from _file_signature()
+        
+    Returns:
+        list: List of task dictionaries, or None if the cache is stale or unreadable
+    """
+    global _task_log_records, _task_log_damaged
+    
+    if source_signature is None:
+        return None
+        
+    try:
+        with open(TASKS_CACHE_FILE, 'r') as cache_file:
+            cached = json.load(cache_file)
+            
+        # The cache is only valid for the exact file it was built from
+        if cached['source'] != source_signature:
+            return None
+            
+        # Dates are stored as ISO strings in the cache
+        task_list = cached['tasks']
+        for task in task_list:
+            task['assigned_date'] = datetime.fromisoformat(task['assigned_date'])
+            task['due_date'] = datetime.fromisoformat(task['due_date'])
+        _task_log_records = cached['records']
+        _task_log_damaged = cached['damaged']
+        return task_list
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_tasks_cache(task_list, source_signature=None):
+    """
+    Save tasks to the JSON cache alongside tasks.txt.
+    
+    Args:
+        task_list (list): List of task dictionaries
+        source_signature (list): Signature of the tasks.txt the tasks were read from,
+            defaults to the file as it is now
+    """
+    if source_signature is None:
+        source_signature = _file_signature("tasks.txt")
+        if source_signature is None:
+            return
+            
+    cached = {
+        'source': source_signature,
+        'records': _task_log_records,
+        'damaged': _task_log_damaged,
+        'tasks': [
+            dict(t, assigned_date=t['assigned_date'].isoformat(), due_date=t['due_date'].isoformat())
+            for t in task_list
+        ]
+    }
+    try:
+        _write_json_atomic(TASKS_CACHE_FILE, cached)
+    except (OSError, TypeError) as e:
+        print(f"Error saving task cache: {e}")
+
+
+def _invalidate_tasks_cache():
+    """
+    Remove the task cache so the next load_tasks() reparses tasks.txt.
+    """
+    try:
+        os.remove(TASKS_CACHE_FILE)
+    except FileNotFoundError:
+        pass
+
+
+def _load_users_cached(source_signature):
+    """
+    Load users from the JSON cache if it was built from the current user.txt.
+    
+    Args:
+        source_signature (list): Current signature of user.txt from _file_signature()
+        
+    Returns:
+        dict: Dictionary mapping usernames to passwords, or None if the cache is stale or unreadable
+    """
+    if source_signature is None:
+        return None
+        
+    try:
+        with open(USERS_CACHE_FILE, 'r') as cache_file:
+            cached = json.load(cache_file)
+            
+        # The cache is only valid for the exact file it was built from
+        if cached['source'] != source_signature:
+            return None
+        username_password = cached['users']
+        return username_password if isinstance(username_password, dict) else None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_users_cache(username_password, source_signature=None):
+    """
+    Save users to the JSON cache alongside user.txt.
+    
+    Args:
+        username_password (dict): Dictionary mapping usernames to passwords
+        source_signature (list): Signature of the user.txt the users were read from,
+            defaults to the file as it is now
+    """
+    if source_signature is None:
+        source_signature = _file_signature("user.txt")
+        if source_signature is None:
+            return
+            
+    try:
+        _write_json_atomic(USERS_CACHE_FILE, {'source': source_signature, 'users': username_password})
+    except (OSError, TypeError) as e:
+        print(f"Error saving user cache: {e}")
+
 
 def load_tasks():
     """
     Load and parse tasks from tasks.txt file.
+    Edit records appended since the last compaction are replayed in order.
+    The parsed result is cached and reused until tasks.txt changes.
     
     Returns:
         list: List of task dictionaries
     """
+    global _task_log_records, _task_log_damaged
     task_list = []
+    file_tasks = []
+    log_records = 0
+    source_signature = None
+    _task_log_damaged = False
     
     try:
         # Return empty list if file doesn't exist or is empty
         if not os.path.exists("tasks.txt") or os.path.getsize("tasks.txt") == 0:
+            _task_log_records = 0
             return []
             
+        # Skip parsing entirely if the cache is up to date. The signature is
+        # taken before reading so a concurrent change can't be cached as current
+        source_signature = _file_signature("tasks.txt")
+        cached_tasks = _load_tasks_cached(source_signature)
+        if cached_tasks is not None:
+            if _task_log_damaged:
+                print(DAMAGED_LOG_WARNING)
+            return cached_tasks
+            
         with open("tasks.txt", 'r') as task_file:
             content = task_file.read()
             
+        # Files without separator lines are in the old semicolon format
+        if SEPARATOR_LINE not in content:
+            raise ValueError("tasks.txt is not in the current format")
+            
         # Split content by task separator (indicated by multiple underscores)
         task_blocks = content.split("\n" + SEPARATOR_LINE + "\n")
         
@@ -36,40 +359,63 @@ def load_tasks():
             if not block.strip():
                 continue
                 
-            # Parse the block into task components
-            task = {}
-            lines = block.strip().split("\n")
-            
-            for i, line in enumerate(lines):
-                if not line.strip() or line.startswith("_"):
+            # Drop the separator lines framing the first and last blocks
+            lines = block.split("\n")
+            if lines[0] == SEPARATOR_LINE:
+                lines = lines[1:]
+            if lines and lines[-1] == SEPARATOR_LINE:
+                lines = lines[:-1]
+            if not lines:
+                continue
+                
+            # Damaged records (e.g. an append cut short) are skipped instead of
+            # discarding the rest of the log. A damaged task keeps its slot so
+            # later edit records still refer to the right task by number
+            log_records += 1
+            is_edit = lines[0].startswith("Edit Task:")
+            try:
+                # Apply edit records to the task they refer to
+                if is_edit:
+                    if len(lines) < 2:
+                        raise ValueError("incomplete edit record")
+                    task_number = int(lines[0][20:])
+                    if not (1 <= task_number <= len(file_tasks)):
+                        raise ValueError(f"edit record for unknown task {task_number}")
+                    task = file_tasks[task_number - 1]
+                    if task is None:
+                        continue
+                    label, value = lines[1][:20].strip(), lines[1][20:].strip()
+                    if label == "Assigned to:":
+                        task['username'] = value
+                    elif label == "Due Date:":
+                        task['due_date'] = _parse_ddmmyyyy(value)
+                    elif label == "Completed:":
+                        task['completed'] = (value == "Yes")
                     continue
                     
-                if ": " in line:
-                    key, value = line.split(": ", 1)
-                    key = key.strip()
-                    value = value.strip()
+                if len(lines) < 6:
+                    raise ValueError("incomplete task record")
                     
-                    if key == "Task":
-                        task['title'] = value
-                    elif key == "Assigned to":
-                        task['username'] = value
-                    elif key == "Date Assigned":
-                        task['assigned_date'] = datetime.strptime(value, DATETIME_STRING_FORMAT)
-                    elif key == "Due Date":
-                        task['due_date'] = datetime.strptime(value, DATETIME_STRING_FORMAT)
-                    elif key == "Completed":
-                        task['completed'] = (value == "Yes")
-                    elif key == "Task Description":
-                        # The description is on the next line
-                        if i + 1 < len(lines):
-                            task['description'] = lines[i + 1].strip()
-                        else:
-                            task['description'] = ""
-            
-            # Only add if we have all required fields
-            if all(key in task for key in ['username', 'title', 'description', 'due_date', 
-                                          'assigned_date', 'completed']):
-                task_list.append(task)
+                # Values start at a fixed column in the order written by save_tasks(),
+                # with the description on the line after its label
+                file_tasks.append({
+                    'title': lines[0][20:].strip(),
+                    'username': lines[1][20:].strip(),
+                    'assigned_date': _parse_ddmmyyyy(lines[2][20:].strip()),
+                    'due_date': _parse_ddmmyyyy(lines[3][20:].strip()),
+                    'completed': lines[4][20:].strip() == "Yes",
+                    'description': lines[6].strip() if len(lines) > 6 else ""
+                })
+            except ValueError as e:
+                print(f"Skipping damaged task record: {e}")
+                _task_log_damaged = True
+                if not is_edit:
+                    file_tasks.append(None)
+                    
+        task_list = [t for t in file_tasks if t is not None]
+        _task_log_records = log_records
+        if _task_log_damaged:
+            print(DAMAGED_LOG_WARNING)
                 
     except Exception as e:
         print(f"Error loading tasks: {e}")
@@ -90,7 +436,7 @@ def load_tasks():
                     
                 # Create task dictionary in one step
                 # Note: This handles the old format which might still be YYYY-MM-DD
-                # We'll try both formats to be safe
+                # so the date format is detected per value
                 task = {
                     'username': task_components[0],
                     'title': task_components[1],
@@ -98,27 +444,48 @@ def load_tasks():
                     'completed': True if task_components[5] == "Yes" else False
                 }
                 
-                # Try the new date format first, fall back to old format if needed
-                try:
-                    task['due_date'] = datetime.strptime(task_components[3], DATETIME_STRING_FORMAT)
-                except ValueError:
-                    task['due_date'] = datetime.strptime(task_components[3], "%Y-%m-%d")
-                    
-                try:
-                    task['assigned_date'] = datetime.strptime(task_components[4], DATETIME_STRING_FORMAT)
-                except ValueError:
-                    task['assigned_date'] = datetime.strptime(task_components[4], "%Y-%m-%d")
+                # Pick the date format from the position of the first dash
+                # instead of trying one format and catching the failure
+                for key, value in (('due_date', task_components[3]), ('assigned_date', task_components[4])):
+                    date_parser = _parse_iso if value.find('-') == 4 else _parse_ddmmyyyy
+                    task[key] = date_parser(value)
                 
                 task_list.append(task)
+                
+            # Don't cache a failed parse, so the error is reported again next time
+            if not task_list:
+                return task_list
+                
+            # Old format file must be rewritten before records can be appended
+            _task_log_records = None
         except Exception as e2:
             print(f"Error loading tasks with fallback method: {e2}")
-        
+            return task_list
+            
+    _save_tasks_cache(task_list, source_signature)
     return task_list
 
 
+def _rebuild_index(task_list):
+    """
+    Rebuild the tasks_by_user index from the task list.
+    
+    Args:
+        task_list (list): List of task dictionaries
+        
+    Returns:
+        dict: Dictionary mapping usernames to ordered lists of task_list indices
+    """
+    tasks_by_user.clear()
+    for i, t in enumerate(task_list):
+        tasks_by_user.setdefault(t['username'], []).append(i)
+    return tasks_by_user
+
+
 def load_users():
     """
     Load users from user.txt file.
+    The parsed result is cached and reused until user.txt changes.
     
     Returns:
         dict: Dictionary mapping usernames to passwords
@@ -131,6 +498,13 @@ def load_users():
             with open("user.txt", "w") as default_file:
                 default_file.write("Username: admin\nPassword: password")
         
+        # Skip parsing entirely if the cache is up to date. The signature is
+        # taken before reading so a concurrent change can't be cached as current
+        source_signature = _file_signature("user.txt")
+        cached_users = _load_users_cached(source_signature)
+        if cached_users is not None:
+            return cached_users
+        
         with open("user.txt", 'r') as user_file:
             content = user_file.read()
             
@@ -169,14 +543,51 @@ def load_users():
                     
     except Exception as e:
         print(f"Error loading users: {e}")
+        return username_password
         
+    _save_users_cache(username_password, source_signature)
     return username_password
 
 
+def _write_task_block(task_file, t):
+    """
+    Write a single task as an aligned two-column block.
+    
+    Args:
+        task_file (file): Open text file to write to
+        t (dict): Task dictionary
+    """
+    task_file.write(_format_task_block(t))
+
+
+def _write_edit_block(task_file, task_index, field, value):
+    """
+    Write an edit record changing one field of an existing task.
+    
+    Args:
+        task_file (file): Open text file to write to
+        task_index (int): Index of the edited task in task_list
+        field (str): Name of the changed field ('username', 'due_date' or 'completed')
+        value: New value of the field
+    """
+    if field == 'username':
+        line = f"{'Assigned to:':<20}{value}"
+    elif field == 'due_date':
+        line = f"{'Due Date:':<20}{_fmt_dmy(value)}"
+    elif field == 'completed':
+        line = f"{'Completed:':<20}{'Yes' if value else 'No'}"
+    else:
+        raise ValueError(f"Field cannot be edited: {field}")
+        
+    task_file.write(f"{SEPARATOR_LINE}\n{'Edit Task:':<20}{task_index + 1}\n{line}\n{SEPARATOR_LINE}")
+
+
 def save_tasks(task_list):
     """
     Save tasks to tasks.txt file with perfectly aligned two-column format.
-    Uses DD-MM-YYYY date format.
+    Uses DD-MM-YYYY date format. The file is written and synced to a temporary
+    path and moved into place, then the JSON cache is refreshed. Any edit records in
+    the log are folded into the tasks they refer to.
     
     Args:
         task_list (list): List of task dictionaries
@@ -184,31 +595,137 @@ def save_tasks(task_list):
     Returns:
         bool: True if successful, False otherwise
     """
+    global _task_log_records, _task_log_appended
+    
     try:
-        with open("tasks.txt", "w") as task_file:
+        with _atomic_write("tasks.txt", buffering=1 << 20) as task_file:
             for i, t in enumerate(task_list):
                 if i > 0:
                     task_file.write("\n")
+                _write_task_block(task_file, t)
                 
-                task_file.write(f"{SEPARATOR_LINE}\n")
-                # Create consistent column widths with left-aligned labels and left-aligned values
-                task_file.write(f"{'Task:':<20}{t['title']}\n")
-                task_file.write(f"{'Assigned to:':<20}{t['username']}\n")
-                task_file.write(f"{'Date Assigned:':<20}{t['assigned_date'].strftime(DATETIME_STRING_FORMAT)}\n")
-                task_file.write(f"{'Due Date:':<20}{t['due_date'].strftime(DATETIME_STRING_FORMAT)}\n")
-                task_file.write(f"{'Completed:':<20}{'Yes' if t['completed'] else 'No'}\n")
-                task_file.write(f"{'Task Description:':<20}\n{t['description']}\n")
-                task_file.write(f"{SEPARATOR_LINE}")
-                
+        _task_log_records = len(task_list)
+        _task_log_appended = False
+        _save_tasks_cache(task_list)
+        return True
+    except Exception as e:
+        print(f"Error saving tasks: {e}")
+        return False
+
+
+def compact_tasks(task_list):
+    """
+    Rewrite tasks.txt without edit records if any have been appended.
+    Only records appended by this process trigger a rewrite, so a file
+    that was merely loaded is never changed.
+    
+    Args:
+        task_list (list): List of task dictionaries
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    if not _task_log_appended:
         return True
+    if _task_log_damaged:
+        print(DAMAGED_LOG_WARNING)
+        return False
+    if _task_log_records == len(task_list):
+        return True
+    return save_tasks(task_list)
+
+
+def _append_task_log(task_list, write_record):
+    """
+    Append one record to tasks.txt instead of rewriting the whole file.
+    The record is synced to disk before the change is reported as saved.
+    The log is compacted once it holds more than twice as many records as tasks.
+    
+    Args:
+        task_list (list): List of task dictionaries
+        write_record (callable): Function writing the record to an open file
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    global _task_log_records, _task_log_appended
+    
+    # Task numbers in a damaged file don't match task_list, so don't add to it
+    if _task_log_damaged:
+        print(DAMAGED_LOG_WARNING)
+        return False
+        
+    # Fall back to a full rewrite if tasks.txt is not in the log format
+    if _task_log_records is None:
+        return save_tasks(task_list)
+        
+    try:
+        with open("tasks.txt", "a") as task_file:
+            if task_file.tell() > 0:
+                task_file.write("\n")
+            write_record(task_file)
+            task_file.flush()
+            os.fsync(task_file.fileno())
+        _task_log_records += 1
+        _task_log_appended = True
+        _invalidate_tasks_cache()
     except Exception as e:
         print(f"Error saving tasks: {e}")
         return False
+        
+    if _task_log_records > 2 * len(task_list):
+        return compact_tasks(task_list)
+    return True
+
+
+def append_task_record(task_list, task_index):
+    """
+    Append a newly added task to tasks.txt.
+    
+    Args:
+        task_list (list): List of task dictionaries
+        task_index (int): Index of the new task
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    return _append_task_log(task_list, lambda task_file: _write_task_block(task_file, task_list[task_index]))
+
+
+def append_task_mutation(task_list, task_index, field):
+    """
+    Append an edit record for one changed field of a task to tasks.txt.
+    
+    Args:
+        task_list (list): List of task dictionaries
+        task_index (int): Index of the edited task
+        field (str): Name of the changed field ('username', 'due_date' or 'completed')
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    value = task_list[task_index][field]
+    return _append_task_log(task_list, lambda task_file: _write_edit_block(task_file, task_index, field, value))
+
+
+def get_users():
+    """
+    Return the registered users, loading them from user.txt on first use.
+    
+    Returns:
+        dict: Dictionary mapping usernames to passwords
+    """
+    global _USERS
+    if _USERS is None:
+        _USERS = load_users()
+    return _USERS
 
 
 def save_users(username_password):
     """
     Save users to user.txt file in a user-friendly format.
+    The file is written and synced to a temporary path and moved into place,
+    then the JSON cache is refreshed.
     
     Args:
         username_password (dict): Dictionary mapping usernames to passwords
@@ -217,25 +734,24 @@ def save_users(username_password):
         bool: True if successful, False otherwise
     """
     try:
-        with open("user.txt", "w") as user_file:
+        with _atomic_write("user.txt") as user_file:
             for i, (username, password) in enumerate(username_password.items()):
                 if i > 0:
                     user_file.write("\n\n")
                 user_file.write(f"Username: {username}\n")
                 user_file.write(f"Password: {password}")
+        _save_users_cache(username_password)
         return True
     except Exception as e:
         print(f"Error saving users: {e}")
         return False
 
 
-def reg_user(username_password):
+def reg_user():
     """
     Register a new user if username doesn't already exist.
-    
-    Args:
-        username_password (dict): Dictionary mapping usernames to passwords
     """
+    username_password = get_users()
     new_username = input("New Username: ")
     
     # Check if username already exists
@@ -256,17 +772,16 @@ def reg_user(username_password):
         print("New user added successfully")
 
 
-def add_task(username_password, task_list):
+def add_task(task_list):
     """
     Add a new task assigned to a valid user.
     Uses DD-MM-YYYY date format for input.
     
     Args:
-        username_password (dict): Dictionary mapping usernames to passwords
         task_list (list): List of task dictionaries
     """
     task_username = input("Name of person assigned to task: ")
-    if task_username not in username_password:
+    if task_username not in get_users():
         print("User does not exist. Please enter a valid username")
         return
         
@@ -278,7 +793,7 @@ def add_task(username_password, task_list):
     while not due_date_time:
         try:
             task_due_date = input("Due date of task (DD-MM-YYYY): ")  # Changed format in prompt
-            due_date_time = datetime.strptime(task_due_date, DATETIME_STRING_FORMAT)
+            due_date_time = _parse_ddmmyyyy(task_due_date)
         except ValueError:
             print("Invalid datetime format. Please use the format DD-MM-YYYY")  # Changed format in error message
     
@@ -293,7 +808,8 @@ def add_task(username_password, task_list):
     }
 
     task_list.append(new_task)
-    if save_tasks(task_list):
+    tasks_by_user.setdefault(task_username, []).append(len(task_list) - 1)
+    if append_task_record(task_list, len(task_list) - 1):
         print("Task successfully added.")
 
 
@@ -311,17 +827,10 @@ def view_all(task_list):
         
     print("\n--- All Tasks ---")
     for t in task_list:
-        print(f"\n{SEPARATOR_LINE}")
-        print(f"{'Task:':<20}{t['title']}")
-        print(f"{'Assigned to:':<20}{t['username']}")
-        print(f"{'Date Assigned:':<20}{t['assigned_date'].strftime(DATETIME_STRING_FORMAT)}")
-        print(f"{'Due Date:':<20}{t['due_date'].strftime(DATETIME_STRING_FORMAT)}")
-        print(f"{'Completed:':<20}{'Yes' if t['completed'] else 'No'}")
-        print(f"{'Task Description:':<20}\n{t['description']}")
-        print(f"{SEPARATOR_LINE}")
+        print(f"\n{_format_task_block(t)}")
 
 
-def edit_task(task_list, task_index, username_password):
+def edit_task(task_list, task_index):
     """
     Edit username or due date for an incomplete task.
     Uses DD-MM-YYYY date format for input.
@@ -329,7 +838,6 @@ def edit_task(task_list, task_index, username_password):
     Args:
         task_list (list): List of task dictionaries
         task_index (int): Index of task to edit
-        username_password (dict): Dictionary mapping usernames to passwords
     """
     if task_list[task_index]['completed']:
         print("Cannot edit a completed task.")
@@ -339,9 +847,12 @@ def edit_task(task_list, task_index, username_password):
     
     if edit_option == 'u':
         new_username = input("Enter new username: ")
-        if new_username in username_password:
+        if new_username in get_users():
+            # Move the task between users in the index, keeping task_list order
+            tasks_by_user[task_list[task_index]['username']].remove(task_index)
+            bisect.insort(tasks_by_user.setdefault(new_username, []), task_index)
             task_list[task_index]['username'] = new_username
-            save_tasks(task_list)
+            append_task_mutation(task_list, task_index, 'username')
             print("Task reassigned successfully!")
         else:
             print("User does not exist. Task not updated.")
@@ -349,9 +860,9 @@ def edit_task(task_list, task_index, username_password):
     elif edit_option == 'd':
         try:
             new_due_date = input("Enter new due date (DD-MM-YYYY): ")  # Changed format in prompt
-            new_date_time = datetime.strptime(new_due_date, DATETIME_STRING_FORMAT)
+            new_date_time = _parse_ddmmyyyy(new_due_date)
             task_list[task_index]['due_date'] = new_date_time
-            save_tasks(task_list)
+            append_task_mutation(task_list, task_index, 'due_date')
             print("Due date updated successfully!")
         except ValueError:
             print("Invalid datetime format. Task not updated.")  # Changed format in error message
@@ -359,7 +870,7 @@ def edit_task(task_list, task_index, username_password):
         print("Invalid choice.")
 
 
-def view_mine(curr_user, task_list, username_password):
+def view_mine(curr_user, task_list):
     """
     View and manage tasks assigned to current user with perfectly aligned columns.
     Uses DD-MM-YYYY date format for display.
@@ -367,10 +878,9 @@ def view_mine(curr_user, task_list, username_password):
     Args:
         curr_user (str): Current username
         task_list (list): List of task dictionaries
-        username_password (dict): Dictionary mapping usernames to passwords
     """
-    # Filter user tasks
-    user_tasks = [t for t in task_list if t['username'] == curr_user]
+    # Look up user tasks through the index, keeping each task's global index
+    user_tasks = [(i, task_list[i]) for i in tasks_by_user.get(curr_user, [])]
     
     if not user_tasks:
         print("You have no tasks assigned to you.")
@@ -378,12 +888,12 @@ def view_mine(curr_user, task_list, username_password):
     
     # Display user tasks with perfect alignment
     print(f"\n--- Tasks assigned to {curr_user} ---")
-    for i, t in enumerate(user_tasks, 1):
+    for i, (_, t) in enumerate(user_tasks, 1):
         print(f"\n{SEPARATOR_LINE}")
         print(f"{'Task Number:':<20}{i}")
         print(f"{'Task:':<20}{t['title']}")
-        print(f"{'Date Assigned:':<20}{t['assigned_date'].strftime(DATETIME_STRING_FORMAT)}")
-        print(f"{'Due Date:':<20}{t['due_date'].strftime(DATETIME_STRING_FORMAT)}")
+        print(f"{'Date Assigned:':<20}{_fmt_dmy(t['assigned_date'])}")
+        print(f"{'Due Date:':<20}{_fmt_dmy(t['due_date'])}")
         print(f"{'Completed:':<20}{'Yes' if t['completed'] else 'No'}")
         print(f"{'Task Description:':<20}\n{t['description']}")
         print(f"{SEPARATOR_LINE}")
@@ -401,20 +911,19 @@ def view_mine(curr_user, task_list, username_password):
                 continue
                 
             # Get selected task and its index in global task_list
-            selected_task = user_tasks[task_choice - 1]
-            global_task_index = task_list.index(selected_task)
+            global_task_index, selected_task = user_tasks[task_choice - 1]
             
             # Task action
             action = input("Enter 'c' to mark as complete or 'e' to edit task: ").lower()
             
             if action == 'c':
-                task_list[global_task_index]['completed'] = True
-                save_tasks(task_list)
+                selected_task['completed'] = True
+                append_task_mutation(task_list, global_task_index, 'completed')
                 print("Task marked as complete!")
                 return
                 
             elif action == 'e':
-                edit_task(task_list, global_task_index, username_password)
+                edit_task(task_list, global_task_index)
                 return
                 
             else:
@@ -424,98 +933,112 @@ def view_mine(curr_user, task_list, username_password):
             print("Invalid input. Please enter a number.")
 
 
-def generate_reports(task_list, username_password):
+def generate_reports(task_list):
     """
     Generate task and user overview reports with perfectly aligned columns.
     Uses DD-MM-YYYY date format in calculations.
     
     Args:
         task_list (list): List of task dictionaries
-        username_password (dict): Dictionary mapping usernames to passwords
     """
+    username_password = get_users()
+    
+    # Overdue tasks are anything due before midnight today
+    overdue_cutoff = datetime.combine(datetime.now().date(), datetime.min.time())
+    
+    # Count (total, completed, overdue) tasks overall and per user in a single pass
+    completed_tasks = overdue_tasks = 0
+    user_stats = defaultdict(lambda: [0, 0, 0])
+    for t in task_list:
+        stats = user_stats[t['username']]
+        stats[0] += 1
+        if t['completed']:
+            stats[1] += 1
+            completed_tasks += 1
+        elif t['due_date'] < overdue_cutoff:
+            stats[2] += 1
+            overdue_tasks += 1
+    
     # Task overview calculations
     total_tasks = len(task_list)
-    completed_tasks = sum(1 for t in task_list if t['completed'])
     uncompleted_tasks = total_tasks - completed_tasks
     
-    # Get overdue tasks (current date comparison)
-    current_date = datetime.now().date()
-    overdue_tasks = sum(1 for t in task_list if not t['completed'] and t['due_date'].date() < current_date)
-    
     # Calculate percentages (avoid division by zero)
     incomplete_percentage = (uncompleted_tasks / total_tasks) * 100 if total_tasks > 0 else 0
     overdue_percentage = (overdue_tasks / total_tasks) * 100 if total_tasks > 0 else 0
     
     # Write task overview report with perfect column alignment
+    report_lines = [
+        f"{SEPARATOR_LINE}\n",
+        f"{'TASK OVERVIEW':^80}\n",  # Center the title
+        f"{SEPARATOR_LINE}\n",
+        f"{'Total number of tasks:':<40}{total_tasks}\n",
+        f"{'Total number of completed tasks:':<40}{completed_tasks}\n",
+        f"{'Total number of uncompleted tasks:':<40}{uncompleted_tasks}\n",
+        f"{'Total number of tasks that are overdue:':<40}{overdue_tasks}\n",
+        f"{'Percentage of tasks that are incomplete:':<40}{incomplete_percentage:.2f}%\n",
+        f"{'Percentage of tasks that are overdue:':<40}{overdue_percentage:.2f}%\n",
+        f"{SEPARATOR_LINE}\n"
+    ]
     with open("task_overview.txt", "w") as report_file:
-        report_file.write(f"{SEPARATOR_LINE}\n")
-        report_file.write(f"{'TASK OVERVIEW':^80}\n")  # Center the title
-        report_file.write(f"{SEPARATOR_LINE}\n")
-        report_file.write(f"{'Total number of tasks:':<40}{total_tasks}\n")
-        report_file.write(f"{'Total number of completed tasks:':<40}{completed_tasks}\n")
-        report_file.write(f"{'Total number of uncompleted tasks:':<40}{uncompleted_tasks}\n")
-        report_file.write(f"{'Total number of tasks that are overdue:':<40}{overdue_tasks}\n")
-        report_file.write(f"{'Percentage of tasks that are incomplete:':<40}{incomplete_percentage:.2f}%\n")
-        report_file.write(f"{'Percentage of tasks that are overdue:':<40}{overdue_percentage:.2f}%\n")
-        report_file.write(f"{SEPARATOR_LINE}\n")
+        report_file.write("".join(report_lines))
     
     # User overview report with perfect column alignment
+    report_lines = [
+        f"{SEPARATOR_LINE}\n",
+        f"{'USER OVERVIEW':^80}\n",  # Center the title
+        f"{SEPARATOR_LINE}\n",
+        f"{'Total number of registered users:':<40}{len(username_password)}\n",
+        f"{'Total number of tasks:':<40}{total_tasks}\n",
+        f"{SEPARATOR_LINE}\n"
+    ]
+    
+    # Calculate statistics for each user
+    for username in username_password:
+        user_task_count, completed_user_tasks, overdue_user_tasks = user_stats.get(username, (0, 0, 0))
+        
+        report_lines.append("\n")
+        report_lines.append(f"{SEPARATOR_LINE}\n")
+        report_lines.append(f"{'User:':<20}{username}\n")
+        report_lines.append(f"{SEPARATOR_LINE}\n")
+        
+        # Skip detailed stats if user has no tasks
+        if user_task_count == 0:
+            report_lines.append("No tasks assigned to this user.\n")
+            continue
+        
+        # Calculate user statistics
+        task_percentage = (user_task_count / total_tasks) * 100 if total_tasks > 0 else 0
+        completed_percentage = (completed_user_tasks / user_task_count) * 100 if user_task_count > 0 else 0
+        uncompleted_percentage = 100 - completed_percentage
+        
+        # Overdue tasks for user
+        overdue_percentage = (overdue_user_tasks / user_task_count) * 100 if user_task_count > 0 else 0
+        
+        # Write user statistics with perfect column alignment
+        report_lines.append(f"{'Total tasks assigned:':<40}{user_task_count}\n")
+        report_lines.append(f"{'Percentage of total tasks:':<40}{task_percentage:.2f}%\n")
+        report_lines.append(f"{'Percentage of tasks completed:':<40}{completed_percentage:.2f}%\n")
+        report_lines.append(f"{'Percentage of tasks to be completed:':<40}{uncompleted_percentage:.2f}%\n")
+        report_lines.append(f"{'Percentage of tasks overdue:':<40}{overdue_percentage:.2f}%\n")
+        report_lines.append(f"{SEPARATOR_LINE}\n")
+    
     with open("user_overview.txt", "w") as report_file:
-        report_file.write(f"{SEPARATOR_LINE}\n")
-        report_file.write(f"{'USER OVERVIEW':^80}\n")  # Center the title
-        report_file.write(f"{SEPARATOR_LINE}\n")
-        report_file.write(f"{'Total number of registered users:':<40}{len(username_password)}\n")
-        report_file.write(f"{'Total number of tasks:':<40}{total_tasks}\n")
-        report_file.write(f"{SEPARATOR_LINE}\n")
-        
-        # Calculate statistics for each user
-        for username in username_password:
-            user_tasks = [t for t in task_list if t['username'] == username]
-            user_task_count = len(user_tasks)
-            
-            report_file.write("\n")
-            report_file.write(f"{SEPARATOR_LINE}\n")
-            report_file.write(f"{'User:':<20}{username}\n")
-            report_file.write(f"{SEPARATOR_LINE}\n")
-            
-            # Skip detailed stats if user has no tasks
-            if user_task_count == 0:
-                report_file.write("No tasks assigned to this user.\n")
-                continue
-            
-            # Calculate user statistics
-            task_percentage = (user_task_count / total_tasks) * 100 if total_tasks > 0 else 0
-            completed_user_tasks = sum(1 for t in user_tasks if t['completed'])
-            completed_percentage = (completed_user_tasks / user_task_count) * 100 if user_task_count > 0 else 0
-            uncompleted_percentage = 100 - completed_percentage
-            
-            # Overdue tasks for user
-            overdue_user_tasks = sum(1 for t in user_tasks 
-                                    if not t['completed'] and t['due_date'].date() < current_date)
-            overdue_percentage = (overdue_user_tasks / user_task_count) * 100 if user_task_count > 0 else 0
-            
-            # Write user statistics with perfect column alignment
-            report_file.write(f"{'Total tasks assigned:':<40}{user_task_count}\n")
-            report_file.write(f"{'Percentage of total tasks:':<40}{task_percentage:.2f}%\n")
-            report_file.write(f"{'Percentage of tasks completed:':<40}{completed_percentage:.2f}%\n")
-            report_file.write(f"{'Percentage of tasks to be completed:':<40}{uncompleted_percentage:.2f}%\n")
-            report_file.write(f"{'Percentage of tasks overdue:':<40}{overdue_percentage:.2f}%\n")
-            report_file.write(f"{SEPARATOR_LINE}\n")
+        report_file.write("".join(report_lines))
     
     print("Reports generated successfully.")
 
 
-def display_statistics(task_list, username_password):
+def display_statistics(task_list):
     """
     Display statistics from generated reports.
     
     Args:
         task_list (list): List of task dictionaries
-        username_password (dict): Dictionary mapping usernames to passwords
     """
     # Generate reports if they don't exist
     if not os.path.exists("task_overview.txt") or not os.path.exists("user_overview.txt"):
-        generate_reports(task_list, username_password)
+        generate_reports(task_list)
     
     # Display task overview
     print("\n===== TASK STATISTICS =====")
@@ -533,9 +1056,9 @@ def login():
     Handle user login process.
     
     Returns:
-        tuple: (username, username_password dictionary)
+        str: Username of the logged in user
     """
-    username_password = load_users()
+    username_password = get_users()
     
     while True:
         print("LOGIN")
@@ -551,7 +1074,18 @@ def login():
             continue
             
         print("Login Successful!")
-        return curr_user, username_password
+        return curr_user
+
+
+def exit_program(task_list):
+    """
+    Compact the task log and exit the program.
+    
+    Args:
+        task_list (list): List of task dictionaries
+    """
+    compact_tasks(task_list)
+    exit('Goodbye!!!')
 
 
 def main():
@@ -564,19 +1098,20 @@ def main():
             pass
             
     # Handle login
-    curr_user, username_password = login()
+    curr_user = login()
     task_list = load_tasks()
+    _rebuild_index(task_list)
     
     # Dictionary of menu options mapped to functions
     menu_options = {
-        'r': lambda: reg_user(username_password),
-        'a': lambda: add_task(username_password, task_list),
+        'r': reg_user,
+        'a': lambda: add_task(task_list),
         'va': lambda: view_all(task_list),
-        'vm': lambda: view_mine(curr_user, task_list, username_password),
-        'gr': lambda: generate_reports(task_list, username_password),
-        'ds': lambda: display_statistics(task_list, username_password) 
+        'vm': lambda: view_mine(curr_user, task_list),
+        'gr': lambda: generate_reports(task_list),
+        'ds': lambda: display_statistics(task_list) 
               if curr_user == 'admin' else print("Only admin users can display statistics."),
-        'e': lambda: exit('Goodbye!!!')
+        'e': lambda: exit_program(task_list)
     }
     
     # Main program loop